@@ -23,15 +23,24 @@ SOFTWARE.
 from math import acosh, log, pi
 
 from fluids.constants import Btu, degree_Fahrenheit, foot, hour, inch
+from fluids.numerics import numpy as np
 
 __all__ = ['R_to_k', 'k_to_R', 'k_to_thermal_resistivity',
-'thermal_resistivity_to_k', 'R_value_to_k', 'k_to_R_value', 'R_cylinder',
+'thermal_resistivity_to_k', 'R_value_to_k', 'R_value_to_k_SI',
+'R_value_to_k_imperial', 'k_to_R_value',
+'R_value_to_k_array', 'k_to_R_value_array', 'R_cylinder',
+'R_cylinder_array', 'R_cylinder_f32', 'R_cylinder_series', 'R_cylinder_grid',
 'S_isothermal_sphere_to_plane', 'S_isothermal_pipe_to_plane',
 'S_isothermal_pipe_normal_to_plane',
 'S_isothermal_pipe_to_isothermal_pipe', 'S_isothermal_pipe_to_two_planes',
 'S_isothermal_pipe_eccentric_to_isothermal_pipe',
 'cylindrical_heat_transfer']
 
+_INV_INCH = 1.0/inch
+_IMPERIAL_R_FACTOR = foot*foot*degree_Fahrenheit*hour/(Btu*inch)
+_INV_IMPERIAL_R_FACTOR = 1.0/_IMPERIAL_R_FACTOR
+_INV_TWO_PI = 1.0/(2.0*pi)
+
 
 def R_to_k(R, t, A=1.):
     r'''Returns the thermal conductivity of a substance given its thickness
@@ -211,6 +220,10 @@ def R_value_to_k(R_value, SI=True):
     If given input is SI, it is divided by 0.0254 (multiplied by 39.37) and
     then inversed. Otherwise, it is multiplied by 6.93347 and then inversed.
 
+    For arrays of R-values, see :obj:`R_value_to_k_array`; when Numba is
+    installed, `ht.numba_vectorized.R_value_to_k` is a compiled NumPy ufunc
+    of this function supporting broadcasting and the `out` argument.
+
     Examples
     --------
     >>> R_value_to_k(0.12), R_value_to_k(0.71, SI=False)
@@ -224,11 +237,54 @@ def R_value_to_k(R_value, SI=True):
     .. [1] Gesellschaft, V. D. I., ed. VDI Heat Atlas. 2nd edition.
        Berlin; New York:: Springer, 2010.
     '''
-    if SI:
-        r = R_value/inch
-    else:
-        r = R_value*(foot*foot*degree_Fahrenheit*hour/Btu/inch)
-    return thermal_resistivity_to_k(r)
+    return 1.0/(R_value*(_INV_INCH if SI else _IMPERIAL_R_FACTOR))
+
+
+def R_value_to_k_SI(R_value):
+    r'''Returns the thermal conductivity of a substance given its R-value in
+    SI units of m^2 K/(W*inch). Equivalent to :obj:`R_value_to_k` with
+    `SI` set to True, but without checking the unit system on each call.
+
+    Parameters
+    ----------
+    R_value : float
+        R-value of a substance [m^2 K/(W*inch)]
+
+    Returns
+    -------
+    k : float
+        Thermal conductivity of a substance [W/m/K]
+
+    Examples
+    --------
+    >>> R_value_to_k_SI(0.12)
+    0.2116666666
+    '''
+    return 1.0/(R_value*_INV_INCH)
+
+
+def R_value_to_k_imperial(R_value):
+    r'''Returns the thermal conductivity of a substance given its R-value in
+    Imperial units of ft^2 deg F*h/(BTU*inch). Equivalent to
+    :obj:`R_value_to_k` with `SI` set to False, but without checking the unit
+    system on each call.
+
+    Parameters
+    ----------
+    R_value : float
+        R-value of a substance [ft^2 deg F*h/(BTU*inch)]
+
+    Returns
+    -------
+    k : float
+        Thermal conductivity of a substance [W/m/K]
+
+    Examples
+    --------
+    >>> R_value_to_k_imperial(0.71)
+    0.2031378716
+    '''
+    return 1.0/(R_value*_IMPERIAL_R_FACTOR)
 
 
 def k_to_R_value(k, SI=True):
@@ -262,11 +318,70 @@ def k_to_R_value(k, SI=True):
     .. [1] Gesellschaft, V. D. I., ed. VDI Heat Atlas. 2nd edition.
        Berlin; New York:: Springer, 2010.
     '''
-    r = k_to_thermal_resistivity(k)
-    if SI:
-        return r*inch
-    else:
-        return r/(foot*foot*degree_Fahrenheit*hour/Btu/inch)
+    return (inch if SI else _INV_IMPERIAL_R_FACTOR)/k
+
+
+def R_value_to_k_array(R_value, SI=True):
+    r'''Returns the thermal conductivities of many substances at once given
+    their R-values, as in :obj:`R_value_to_k`. `SI` may be a single bool or
+    an array of bools selecting the unit system of each R-value.
+
+    Parameters
+    ----------
+    R_value : ndarray
+        R-values of the substances [m^2 K/(W*inch) or ft^2 deg F*h/(BTU*inch)]
+    SI : bool or ndarray, optional
+        Whether to use the SI conversion or not, for each R-value
+
+    Returns
+    -------
+    k : ndarray
+        Thermal conductivities of the substances [W/m/K]
+
+    Notes
+    -----
+    Requires NumPy. :obj:`R_to_k`, :obj:`k_to_R`,
+    :obj:`k_to_thermal_resistivity` and :obj:`thermal_resistivity_to_k` are
+    plain arithmetic and already accept arrays directly; only the R-value
+    conversions need a separate array form, because of the `SI` branch.
+
+    Examples
+    --------
+    >>> R_value_to_k_array(np.array([0.12, 0.71]), np.array([True, False]))
+    array([0.21166667, 0.20313787])
+    '''
+    return 1.0/(R_value*np.where(SI, _INV_INCH, _IMPERIAL_R_FACTOR))
+
+
+def k_to_R_value_array(k, SI=True):
+    r'''Returns the R-values of many substances at once given their thermal
+    conductivities, as in :obj:`k_to_R_value`. `SI` may be a single bool or
+    an array of bools selecting the unit system of each R-value.
+
+    Parameters
+    ----------
+    k : ndarray
+        Thermal conductivities of the substances [W/m/K]
+    SI : bool or ndarray, optional
+        Whether to use the SI conversion or not, for each R-value
+
+    Returns
+    -------
+    R_value : ndarray
+        R-values of the substances [m^2 K/(W*inch) or ft^2 deg F*h/(BTU*inch)]
+
+    Notes
+    -----
+    Requires NumPy. Provides the reverse conversion of
+    :obj:`R_value_to_k_array`.
+
+    Examples
+    --------
+    >>> SI = np.array([True, False])
+    >>> k_to_R_value_array(R_value_to_k_array(np.array([0.12, 0.71]), SI), SI)
+    array([0.12, 0.71])
+    '''
+    return np.where(SI, inch, _INV_IMPERIAL_R_FACTOR)/k
 
 
 def R_cylinder(Di, Do, k, L):
@@ -306,8 +421,177 @@ def R_cylinder(Di, Do, k, L):
        David P. DeWitt. Introduction to Heat Transfer. 6E. Hoboken, NJ:
        Wiley, 2011.
     '''
-    hA = k*2*pi*L/log(Do/Di)
-    return 1./hA
+    return log(Do/Di)*_INV_TWO_PI/(k*L)
+
+
+def R_cylinder_array(Di, Do, k, L):
+    r'''Returns the thermal resistances `R` of many cylinders at once, as in
+    :obj:`R_cylinder`, operating on whole arrays of inner and outer diameter,
+    thermal conductivity, and length. Scalar arguments are broadcast.
+
+    .. math::
+        R_{\text{cylinder}} = \frac{\ln(D_o/D_i)}{2\pi Lk}
+
+    Parameters
+    ----------
+    Di : ndarray
+        Inner diameters of the cylinders, [m]
+    Do : ndarray
+        Outer diameters of the cylinders, [m]
+    k : ndarray
+        Thermal conductivities of the cylinders, [W/m/K]
+    L : ndarray
+        Lengths of the cylinders, [m]
+
+    Returns
+    -------
+    R : ndarray
+        Thermal resistances [K/W]
+
+    Notes
+    -----
+    Requires NumPy. The whole calculation is a handful of elementwise array
+    operations, so it is far faster than calling :obj:`R_cylinder` in a loop;
+    `ht.numba.R_cylinder_array` compiles it into a single fused loop.
+
+    Examples
+    --------
+    >>> R_cylinder_array(np.array([0.9, 0.8]), np.array([1., 1.]), 20., 10.)
+    array([8.38432344e-05, 1.77571996e-04])
+    '''
+    return np.log(Do/Di)*_INV_TWO_PI/(k*L)
+
+def R_cylinder_f32(Di, Do, k, L):
+    r'''Returns the thermal resistances `R` of many cylinders at once, as in
+    :obj:`R_cylinder_array`, but computed entirely in single precision
+    (float32). All inputs are converted to float32 and the result is float32.
+
+    Parameters
+    ----------
+    Di : ndarray
+        Inner diameters of the cylinders, [m]
+    Do : ndarray
+        Outer diameters of the cylinders, [m]
+    k : ndarray
+        Thermal conductivities of the cylinders, [W/m/K]
+    L : ndarray
+        Lengths of the cylinders, [m]
+
+    Returns
+    -------
+    R : ndarray
+        Thermal resistances [K/W]
+
+    Notes
+    -----
+    Requires NumPy. Single precision halves the memory traffic per element
+    and doubles the number of SIMD lanes, which matters for very large
+    sweeps; the relative error is on the order of 1E-7, far below the
+    uncertainty of any thermal conductivity. Use :obj:`R_cylinder_array` when
+    double precision is wanted. Under `ht.numba` the calculation also stays in
+    float32.
+
+    Examples
+    --------
+    >>> R_cylinder_f32(np.array([0.9, 0.8]), np.array([1., 1.]), 20., 10.)
+    array([8.3843275e-05, 1.7757197e-04], dtype=float32)
+    '''
+    f32 = np.float32
+    Di = np.asarray(Di, dtype=f32)
+    Do = np.asarray(Do, dtype=f32)
+    k = np.asarray(k, dtype=f32)
+    L = np.asarray(L, dtype=f32)
+    return np.log(Do/Di)*f32(_INV_TWO_PI)/(k*L)
+
+
+def R_cylinder_series(Ds, ks, L):
+    r'''Returns the total thermal resistance `R` of a composite cylinder made
+    of several concentric layers in series, such as a pipe wall with one or
+    more layers of insulation. Layer `i` spans diameters `Ds[i]` to
+    `Ds[i+1]` and has thermal conductivity `ks[i]`.
+
+    .. math::
+        R = \frac{1}{2\pi L}\sum_i \frac{\ln(D_{i+1}/D_i)}{k_i}
+
+    Parameters
+    ----------
+    Ds : ndarray
+        Diameters of every layer boundary, from innermost to outermost;
+        one more than the number of layers, [m]
+    ks : ndarray
+        Thermal conductivities of each layer, [W/m/K]
+    L : float
+        Length of the cylinder, [m]
+
+    Returns
+    -------
+    R : float
+        Total thermal resistance [K/W]
+
+    Notes
+    -----
+    Requires NumPy. Equivalent to summing :obj:`R_cylinder` over each layer,
+    but evaluated as a single pass over the arrays.
+
+    Examples
+    --------
+    >>> R_cylinder_series(np.array([0.9, 1., 1.2]), np.array([20., 0.05]), 10)
+    0.058118597226
+    '''
+    Ds = np.asarray(Ds)
+    return float(np.sum(np.log(Ds[1:]/Ds[:-1])/ks))*_INV_TWO_PI/L
+
+def R_cylinder_grid(Di, Do, k, L):
+    r'''Returns the thermal resistances `R` of cylinders for every combination
+    of an array of inner diameters `Di` and an array of outer diameters `Do`,
+    as in :obj:`R_cylinder`, for a single thermal conductivity `k` and length
+    `L`. Useful for design sweeps over wall thickness.
+
+    .. math::
+        R_{ij} = \frac{\ln D_{o,j} - \ln D_{i,i}}{2\pi Lk}
+
+    Parameters
+    ----------
+    Di : ndarray
+        Inner diameters of the cylinders, [m]
+    Do : ndarray
+        Outer diameters of the cylinders, [m]
+    k : float
+        Thermal conductivity of the cylinders, [W/m/K]
+    L : float
+        Length of the cylinders, [m]
+
+    Returns
+    -------
+    R : ndarray
+        Thermal resistances, with one row per inner diameter and one column
+        per outer diameter [K/W]
+
+    Notes
+    -----
+    Requires NumPy. Rather than taking the log of each of the N*M diameter
+    ratios, the logs of the N inner and M outer diameters are computed once,
+    scaled by :math:`1/(2\pi Lk)`, and the grid is filled with a single
+    broadcast subtraction; no full-size temporary is created.
+
+    For very thin walls the difference of logs cancels; with `Do/Di` within
+    1E-6 of one, the relative error is around 1E-10, still negligible
+    compared to the uncertainty of `k`.
+
+    Examples
+    --------
+    >>> R_cylinder_grid(np.array([0.8, 0.9]), np.array([1., 1.1]), 20., 10.)
+    array([[1.77571996e-04, 2.53417427e-04],
+           [8.38432344e-05, 1.59688666e-04]])
+    '''
+    Di = np.asarray(Di)
+    Do = np.asarray(Do)
+    factor = _INV_TWO_PI/(k*L)
+    log_Di = np.log(Di)*factor
+    log_Do = np.log(Do)*factor
+    out = np.empty((Di.size, Do.size))
+    np.subtract(log_Do.reshape((1, Do.size)), log_Di.reshape((Di.size, 1)), out)
+    return out
 
 ### Shape Factors
 
@@ -20,6 +20,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
 
+import numpy as np
 import pytest
 from fluids.numerics import assert_close, assert_close1d
 
@@ -28,8 +29,15 @@ from ht import (
     ASHRAE_k,
     Cp_material,
     R_cylinder,
+    R_cylinder_array,
+    R_cylinder_f32,
+    R_cylinder_grid,
+    R_cylinder_series,
     R_to_k,
     R_value_to_k,
+    R_value_to_k_array,
+    R_value_to_k_imperial,
+    R_value_to_k_SI,
     S_isothermal_pipe_eccentric_to_isothermal_pipe,
     S_isothermal_pipe_normal_to_plane,
     S_isothermal_pipe_to_isothermal_pipe,
@@ -41,6 +49,7 @@ from ht import (
     k_material,
     k_to_R,
     k_to_R_value,
+    k_to_R_value_array,
     k_to_thermal_resistivity,
     materials_dict,
     nearest_material,
@@ -62,6 +71,8 @@ def test_conduction():
     Rs = [R_value_to_k(0.12), R_value_to_k(0.71, SI=False)]
     assert_close1d(Rs, [0.2116666666666667, 0.20313787163983468])
     assert_close(R_value_to_k(1., SI=False)/R_value_to_k(1.), 5.678263341113488)
+    assert_close(R_value_to_k_SI(0.12), R_value_to_k(0.12), rtol=1e-15)
+    assert_close(R_value_to_k_imperial(0.71), R_value_to_k(0.71, SI=False), rtol=1e-15)
 
 
     values =  k_to_R_value(R_value_to_k(0.12)), k_to_R_value(R_value_to_k(0.71, SI=False), SI=False)
@@ -79,6 +90,72 @@ def test_conduction():
     assert_close(S_isothermal_pipe_eccentric_to_isothermal_pipe(.1, .4, .05, 10.), 47.709841915608976)
 
 
+def test_R_value_array():
+    R_values = np.array([0.12, 0.71, 1.0, 1.0])
+    SIs = np.array([True, False, True, False])
+    expect = [R_value_to_k(R, SI=bool(SI)) for R, SI in zip(R_values, SIs)]
+    ks = R_value_to_k_array(R_values, SIs)
+    assert_close1d(ks, expect)
+    assert_close1d(k_to_R_value_array(ks, SIs), R_values)
+
+    assert_close1d(R_value_to_k_array(R_values), [R_value_to_k(R) for R in R_values])
+    assert_close1d(R_value_to_k_array(R_values, False), [R_value_to_k(R, SI=False) for R in R_values])
+    assert_close1d(k_to_R_value_array(ks, False), [k_to_R_value(k, SI=False) for k in ks])
+
+
+def test_R_cylinder_array():
+    Dis = np.array([0.9, 0.8, 0.05])
+    Dos = np.array([1., 1., 0.06])
+    ks = np.array([20., 15., 0.04])
+    Ls = np.array([10., 2., 1.])
+    expect = [R_cylinder(Di, Do, k, L) for Di, Do, k, L in zip(Dis, Dos, ks, Ls)]
+    assert_close1d(R_cylinder_array(Dis, Dos, ks, Ls), expect)
+
+    # Scalar arguments broadcast
+    assert_close1d(R_cylinder_array(Dis, Dos, 20., 10.),
+                   [R_cylinder(Di, Do, 20., 10.) for Di, Do in zip(Dis, Dos)])
+
+
+def test_R_cylinder_f32():
+    Dis = np.array([0.9, 0.8, 0.05])
+    Dos = np.array([1., 1., 0.06])
+    ks = np.array([20., 15., 0.04])
+    Ls = np.array([10., 2., 1.])
+    R = R_cylinder_f32(Dis, Dos, ks, Ls)
+    assert R.dtype == np.float32
+    assert_close1d(R, R_cylinder_array(Dis, Dos, ks, Ls), rtol=1e-6)
+
+    R = R_cylinder_f32(Dis.astype(np.float32), Dos.astype(np.float32), 20., 10.)
+    assert R.dtype == np.float32
+    assert_close1d(R, R_cylinder_array(Dis, Dos, 20., 10.), rtol=1e-6)
+
+
+def test_R_cylinder_grid():
+    Dis = np.linspace(0.05, 0.1, 7)
+    Dos = np.linspace(0.11, 0.2, 5)
+    expect = [[R_cylinder(Di, Do, 0.5, 2.) for Do in Dos] for Di in Dis]
+    R = R_cylinder_grid(Dis, Dos, 0.5, 2.)
+    assert R.shape == (7, 5)
+    for row, row_expect in zip(R, expect):
+        assert_close1d(row, row_expect)
+
+    # Thin walls, where ln(Do) - ln(Di) is a small difference of logs
+    Dis = np.array([0.1, 1.0, 10.0])
+    Dos = Dis*(1.0 + 1e-6)
+    R = R_cylinder_grid(Dis, Dos, 0.5, 2.)
+    assert_close1d(R.diagonal(), [R_cylinder(Di, Do, 0.5, 2.) for Di, Do in zip(Dis, Dos)], rtol=1e-8)
+
+
+def test_R_cylinder_series():
+    Ds = np.array([0.0779272, 0.0889, 0.1889, 0.2])
+    ks = np.array([56.045, 0.0598535265, 0.2])
+    expect = sum(R_cylinder(Ds[i], Ds[i+1], ks[i], 3.) for i in range(3))
+    assert_close(R_cylinder_series(Ds, ks, 3.), expect)
+
+    # Lists work too, and a single layer matches R_cylinder
+    assert_close(R_cylinder_series([0.9, 1.], [20.], 10.), R_cylinder(0.9, 1., 20., 10.))
+
+
 def test_cylindrical_heat_transfer():
     data = cylindrical_heat_transfer(Ti=453.15, To=301.15, hi=1e12, ho=22.697193, Di=0.0779272, ts=[0.0054864, .05], ks=[56.045, 0.0598535265])
     expect = {'Q': 73.12000884069367,
@@ -23,7 +23,7 @@ SOFTWARE.
 import pytest
 from fluids import AirCooledExchanger
 from fluids.constants import foot, inch
-from fluids.numerics import assert_close
+from fluids.numerics import assert_close, assert_close1d
 
 import ht.vectorized
 from ht import Nu_external_horizontal_plate_methods, h_Ganguli_VDI
@@ -364,6 +364,27 @@ def test_conduction():
     assert_close(ht.numba.S_isothermal_pipe_to_isothermal_pipe(.1, .2, 1, 1),
                  ht.S_isothermal_pipe_to_isothermal_pipe(.1, .2, 1, 1))
 
+    assert_close(ht.numba.R_cylinder(0.9, 1., 20., 10.), ht.R_cylinder(0.9, 1., 20., 10.))
+
+    Dis, Dos = np.array([0.9, 0.8]), np.array([1., 1.])
+    ks, Ls = np.array([20., 15.]), np.array([10., 2.])
+    assert_close1d(ht.numba.R_cylinder_array(Dis, Dos, ks, Ls),
+                   ht.R_cylinder_array(Dis, Dos, ks, Ls))
+    R = ht.numba.R_cylinder_f32(Dis, Dos, 20., 10.)
+    assert R.dtype == np.float32
+    assert_close1d(R, ht.R_cylinder_f32(Dis, Dos, 20., 10.), rtol=1e-6)
+    assert_close1d(ht.numba.R_cylinder_grid(Dis, Dos, 20., 10.).ravel(),
+                   ht.R_cylinder_grid(Dis, Dos, 20., 10.).ravel())
+    assert_close(ht.numba.R_cylinder_series(np.array([0.9, 1., 1.2]), np.array([20., 0.05]), 10.),
+                 ht.R_cylinder_series(np.array([0.9, 1., 1.2]), np.array([20., 0.05]), 10.))
+
+    R_values, SIs = np.array([0.12, 0.71, 1.0]), np.array([True, False, False])
+    expect = [ht.R_value_to_k(R, SI=bool(SI)) for R, SI in zip(R_values, SIs)]
+    assert_close1d(ht.numba_vectorized.R_value_to_k(R_values, SIs), expect)
+    out = np.empty(3)
+    ht.numba_vectorized.R_value_to_k(R_values, SIs, out=out)
+    assert_close1d(out, expect)
+
     # cylindrical_heat_transfer returns a dictionary, not supported by numba
 
 @mark_as_numba